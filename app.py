@@ -1,13 +1,44 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, session
+from flask import Flask, Response, abort, render_template, request, jsonify, redirect, url_for, session
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateIndex
 from datetime import datetime, date, timedelta
 from config import Config
+import functools
 import json
 import re
 import os
+import orjson
 
-app = Flask(__name__)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which also encodes dates natively."""
+    option = orjson.OPT_NAIVE_UTC
+
+    def dumps(self, obj, **kwargs):
+        option = self.option
+        if kwargs.get('sort_keys'):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option),
+            mimetype=self.mimetype
+        )
+
+
+class ORJSONFlask(Flask):
+    json_provider_class = ORJSONProvider
+
+
+app = ORJSONFlask(__name__)
 app.config.from_object(Config)
 
 db = SQLAlchemy(app)
@@ -39,10 +70,13 @@ else:
 
 # Setup Gemini if API key is provided
 GEMINI_ENABLED = False
+_GEMINI_MODEL = None
 if app.config.get('GEMINI_API_KEY'):
     try:
         import google.generativeai as genai
-        genai.configure(api_key=app.config['GEMINI_API_KEY'])
+        # REST transport goes through requests, which gevent can patch
+        genai.configure(api_key=app.config['GEMINI_API_KEY'], transport='rest')
+        _GEMINI_MODEL = genai.GenerativeModel('gemini-1.5-flash')
         GEMINI_ENABLED = True
     except Exception as e:
         print(f"Gemini setup failed: {e}")
@@ -60,6 +94,18 @@ CATEGORIES = {
     'other': {'label': 'Other', 'color': '#71717a', 'icon': '📌'}
 }
 
+# (color, label, icon) per category, for serializing tasks
+_CAT_INFO = {cat: (v['color'], v['label'], v['icon']) for cat, v in CATEGORIES.items()}
+
+# Category color stored on tasks at write time
+_CAT_COLOR = {cat: v['color'] for cat, v in CATEGORIES.items()}
+_DEFAULT_COLOR = _CAT_COLOR['other']
+
+# Categories are static per deploy, so encode the API payload once
+_CATEGORIES_JSON = orjson.dumps(CATEGORIES)
+
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
 
 # ===== Models =====
 class User(UserMixin, db.Model):
@@ -87,30 +133,54 @@ class Task(db.Model):
     original_input = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Serves the per-day calendar query (filter by user/date, order by time)
+    __table_args__ = (
+        db.Index('ix_task_user_date_time', 'user_id', 'date', 'time_slot'),
+    )
+
     def to_dict(self):
-        cat_info = CATEGORIES.get(self.category, CATEGORIES['other'])
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'date': self.date.isoformat(),
-            'time_slot': self.time_slot,
-            'duration': self.duration,
-            'completed': self.completed,
-            'priority': self.priority,
-            'color': cat_info['color'],
-            'category': self.category,
-            'category_label': cat_info['label'],
-            'category_icon': cat_info['icon']
-        }
+        return task_to_dict(self)
+
+
+# Columns needed to serialize a task, for queries that skip ORM hydration
+TASK_COLUMNS = (Task.id, Task.title, Task.description, Task.date, Task.time_slot,
+                Task.duration, Task.completed, Task.priority, Task.category)
+
+
+def task_to_dict(task):
+    """Serialize a Task or a row selected with TASK_COLUMNS."""
+    color, label, icon = _CAT_INFO.get(task.category, _CAT_INFO['other'])
+    return {
+        'id': task.id,
+        'title': task.title,
+        'description': task.description,
+        'date': task.date,
+        'time_slot': task.time_slot,
+        'duration': task.duration,
+        'completed': task.completed,
+        'priority': task.priority,
+        'color': color,
+        'category': task.category,
+        'category_label': label,
+        'category_icon': icon
+    }
 
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id))
 
 
 # ===== AI Functions =====
+# Decodes the first JSON object in a Gemini response, ignoring trailing text
+_JSON_DECODER = json.JSONDecoder()
+# Inputs whose meaning depends on the current time ("in 2 hours", "now")
+_RELATIVE_TIME_RE = re.compile(
+    r'\b(in\s+(an?|half|\d+)|now|later|soon|asap|tonight|right\s+away|this\s+(morning|afternoon|evening))\b',
+    re.IGNORECASE
+)
+
+
 def parse_task_with_gemini(user_input, reference_date=None):
     """Use Google Gemini to parse natural language task input."""
     if not GEMINI_ENABLED:
@@ -119,24 +189,45 @@ def parse_task_with_gemini(user_input, reference_date=None):
     if reference_date is None:
         reference_date = date.today()
     
+    # Inputs relative to the current time can't reuse an earlier answer
+    gemini_parse = _gemini_parse if _RELATIVE_TIME_RE.search(user_input) else _gemini_parse_cached
+    try:
+        return json.loads(gemini_parse(user_input, reference_date.isoformat()))
+    except Exception as e:
+        print(f"Gemini API error: {e}")
+    
+    return fallback_parse(user_input, reference_date)
+
+
+@functools.lru_cache(maxsize=64)
+def _days_ahead(ref_ordinal):
+    """JSON mapping of day names to dates for the week starting at ref_ordinal."""
+    reference_date = date.fromordinal(ref_ordinal)
+    days = {}
+    for i in range(7):
+        future_date = reference_date + timedelta(days=i)
+        days[WEEKDAYS[future_date.weekday()]] = future_date.isoformat()
+    return json.dumps(days)
+
+
+def _gemini_parse(user_input, reference_date_iso):
+    """Call Gemini and return the parsed task as a JSON string.
+    
+    Raises on failure so errors are never cached by _gemini_parse_cached.
+    """
+    reference_date = date.fromisoformat(reference_date_iso)
     today_str = reference_date.strftime('%Y-%m-%d')
     tomorrow_str = (reference_date + timedelta(days=1)).strftime('%Y-%m-%d')
     day_of_week = reference_date.strftime('%A')
     current_time = datetime.now().strftime('%H:%M')
     
-    # Calculate dates for day names
-    days_ahead = {}
-    for i in range(7):
-        future_date = reference_date + timedelta(days=i)
-        days_ahead[future_date.strftime('%A').lower()] = future_date.strftime('%Y-%m-%d')
-    
     prompt = f"""You are a premium executive assistant AI for "Tempo" - an elegant day planner app. Your job is to transform casual user input into beautifully crafted, professional calendar entries.
 
 CONTEXT:
 - Today: {today_str} ({day_of_week})
 - Current time: {current_time}
 - Tomorrow: {tomorrow_str}
-- This week's dates: {json.dumps(days_ahead)}
+- This week's dates: {_days_ahead(reference_date.toordinal())}
 
 USER INPUT: "{user_input}"
 
@@ -193,26 +284,126 @@ Return ONLY a valid JSON object with these exact keys:
 
 JSON ONLY - no markdown, no explanation:"""
 
+    response = _GEMINI_MODEL.generate_content(prompt, stream=True)
+    
+    # Stop reading the stream as soon as a complete task object has arrived
+    chunks = iter(response)
+    result = ''
     try:
-        import google.generativeai as genai
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        response = model.generate_content(prompt)
-        result = response.text.strip()
-        
-        # Clean up response - extract JSON
-        if '```' in result:
-            result = re.sub(r'```json?\s*', '', result)
-            result = re.sub(r'```\s*', '', result)
-        
-        json_match = re.search(r'\{[^{}]*\}', result, re.DOTALL)
-        if json_match:
-            parsed = json.loads(json_match.group())
-            if 'title' in parsed:
-                return parsed
-    except Exception as e:
-        print(f"Gemini API error: {e}")
+        for chunk in chunks:
+            text = chunk.text
+            result += text
+            if '}' in text:
+                parsed = _extract_task_json(result)
+                if parsed:
+                    return json.dumps(parsed)
+    finally:
+        # Release the stream now rather than at garbage collection
+        if hasattr(chunks, 'close'):
+            chunks.close()
     
-    return fallback_parse(user_input, reference_date)
+    raise ValueError('No task JSON found in Gemini response')
+
+
+# Repeated inputs skip the network call. The key has no current time, so
+# parse_task_with_gemini bypasses it for time-relative inputs.
+_gemini_parse_cached = functools.lru_cache(maxsize=1024)(_gemini_parse)
+
+
+def _extract_task_json(result):
+    """Parse the task object out of (possibly partial) Gemini output, or None."""
+    # Decode the first complete object, ignoring markdown fences or any text
+    # around it
+    start = result.find('{')
+    if start == -1:
+        return None
+    try:
+        parsed, _ = _JSON_DECODER.raw_decode(result, start)
+    except ValueError:
+        return None  # Object not closed yet
+    if isinstance(parsed, dict) and 'title' in parsed:
+        return parsed
+    return None
+
+
+# Precompiled patterns for fallback_parse
+# Every time shape in one pattern: "at 3:30 pm", "at 3pm", "15:30", "3 pm"
+_TIME_RE = re.compile(r'(?P<at>\bat\s+)?(?P<h>\d{1,2})(?::(?P<m>\d{2}))?\s*(?P<ap>am|pm)?\b', re.IGNORECASE)
+_TOMORROW_RE = re.compile(r'\btomorrow\b', re.IGNORECASE)
+# (day, weekday index, pattern); callers check `day in text` before using the regex
+_DAY_RES = [(day, i, re.compile(rf'\b{day}\b', re.IGNORECASE)) for i, day in enumerate(WEEKDAYS)]
+_DURATION_RE = re.compile(r'for\s+(\d+)\s*(hour|hr|min|minute)')
+_DURATION_STRIP_RE = re.compile(r'for\s+\d+\s*(hour|hr|min|minute)s?', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+_LEADING_PREP_RE = re.compile(r'^(at|for|on)\s+', re.IGNORECASE)
+
+# Keyword categorization and smart defaults for fallback_parse
+CATEGORY_CONFIG = {
+    'work': {
+        'keywords': ['meeting', 'work', 'office', 'email', 'project', 'deadline', 'client', 'report', 'presentation'],
+        'duration': 60,
+        'priority': 'medium'
+    },
+    'health': {
+        'keywords': ['gym', 'workout', 'exercise', 'doctor', 'medicine', 'run', 'yoga', 'dentist', 'therapy'],
+        'duration': 60,
+        'priority': 'high'
+    },
+    'errands': {
+        'keywords': ['buy', 'shop', 'return', 'pick up', 'pickup', 'drop off', 'amazon', 'store', 'grocery'],
+        'duration': 45,
+        'priority': 'medium'
+    },
+    'finance': {
+        'keywords': ['pay', 'bill', 'bank', 'tax', 'budget', 'invoice', 'rent', 'insurance'],
+        'duration': 30,
+        'priority': 'high'
+    },
+    'social': {
+        'keywords': ['call', 'meet', 'lunch', 'dinner', 'party', 'friend', 'family', 'mom', 'dad', 'coffee'],
+        'duration': 60,
+        'priority': 'medium'
+    },
+    'learning': {
+        'keywords': ['study', 'learn', 'read', 'course', 'class', 'practice', 'tutorial', 'exam'],
+        'duration': 90,
+        'priority': 'medium'
+    },
+    'home': {
+        'keywords': ['clean', 'cook', 'laundry', 'repair', 'organize', 'dishes', 'vacuum'],
+        'duration': 45,
+        'priority': 'low'
+    },
+    'personal': {
+        'keywords': ['appointment', 'haircut', 'spa', 'self-care', 'relax'],
+        'duration': 60,
+        'priority': 'low'
+    }
+}
+
+# One alternation per category, checked in CATEGORY_CONFIG order
+_CATEGORY_RES = [
+    (cat, re.compile('|'.join(re.escape(kw) for kw in config['keywords'])), config)
+    for cat, config in CATEGORY_CONFIG.items()
+]
+
+
+def find_time(text):
+    """Best time match in text, in a single scan.
+    
+    Bare numbers are ignored. Preference order: "at 3:30 pm", "at 3pm",
+    "3:30 pm", "3pm"; ties go to the earliest match.
+    """
+    best, best_rank = None, 4
+    for match in _TIME_RE.finditer(text):
+        if not (match.group('m') or match.group('ap')):
+            continue
+        rank = (0 if match.group('at') else 2) + (0 if match.group('m') else 1)
+        if rank < best_rank:
+            best, best_rank = match, rank
+            if rank == 0:
+                break
+    return best
 
 
 def fallback_parse(user_input, reference_date=None):
@@ -230,29 +421,12 @@ def fallback_parse(user_input, reference_date=None):
     description = ''
     
     # Extract time (e.g., "at 3pm", "at 14:30", "10am", "7:30pm")
-    # Pattern 1: "at 3:30 pm" or "at 3:30pm" or "at 15:30"
-    time_match = re.search(r'at\s+(\d{1,2}):(\d{2})\s*(am|pm)?', text, re.IGNORECASE)
-    if not time_match:
-        # Pattern 2: "at 3pm" or "at 3 pm"
-        time_match = re.search(r'at\s+(\d{1,2})\s*(am|pm)', text, re.IGNORECASE)
-    if not time_match:
-        # Pattern 3: "3:30pm" or "3:30 pm" or "15:30"
-        time_match = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm)?', text, re.IGNORECASE)
-    if not time_match:
-        # Pattern 4: "3pm" or "3 pm"
-        time_match = re.search(r'(\d{1,2})\s*(am|pm)', text, re.IGNORECASE)
+    time_match = find_time(text)
     
     if time_match:
-        groups = time_match.groups()
-        hour = int(groups[0])
-        
-        # Check if second group is minutes (digits) or am/pm
-        if len(groups) >= 2 and groups[1] and groups[1].isdigit():
-            minute = int(groups[1])
-            ampm = groups[2].lower() if len(groups) > 2 and groups[2] else None
-        else:
-            minute = 0
-            ampm = groups[1].lower() if len(groups) > 1 and groups[1] else None
+        hour = int(time_match.group('h'))
+        minute = int(time_match.group('m') or 0)
+        ampm = time_match.group('ap')
         
         # Convert to 24-hour format
         if ampm == 'pm' and hour < 12:
@@ -267,21 +441,20 @@ def fallback_parse(user_input, reference_date=None):
     # Extract date (tomorrow, day names)
     if 'tomorrow' in text:
         task_date = reference_date + timedelta(days=1)
-        title = re.sub(r'\btomorrow\b', '', title, flags=re.IGNORECASE).strip()
+        title = _TOMORROW_RE.sub('', title).strip()
     else:
-        days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        for i, day in enumerate(days):
+        for day, i, pattern in _DAY_RES:
             if day in text:
                 current_day = reference_date.weekday()
                 days_ahead = (i - current_day) % 7
                 if days_ahead == 0:
                     days_ahead = 7
                 task_date = reference_date + timedelta(days=days_ahead)
-                title = re.sub(rf'\b{day}\b', '', title, flags=re.IGNORECASE).strip()
+                title = pattern.sub('', title).strip()
                 break
     
     # Extract duration
-    duration_match = re.search(r'for\s+(\d+)\s*(hour|hr|min|minute)', text)
+    duration_match = _DURATION_RE.search(text)
     if duration_match:
         num = int(duration_match.group(1))
         unit = duration_match.group(2)
@@ -289,54 +462,11 @@ def fallback_parse(user_input, reference_date=None):
             duration = num * 60
         else:
             duration = num
-        title = re.sub(r'for\s+\d+\s*(hour|hr|min|minute)s?', '', title, flags=re.IGNORECASE).strip()
+        title = _DURATION_STRIP_RE.sub('', title).strip()
     
     # Categorize based on keywords and set smart defaults
-    category_config = {
-        'work': {
-            'keywords': ['meeting', 'work', 'office', 'email', 'project', 'deadline', 'client', 'report', 'presentation'],
-            'duration': 60,
-            'priority': 'medium'
-        },
-        'health': {
-            'keywords': ['gym', 'workout', 'exercise', 'doctor', 'medicine', 'run', 'yoga', 'dentist', 'therapy'],
-            'duration': 60,
-            'priority': 'high'
-        },
-        'errands': {
-            'keywords': ['buy', 'shop', 'return', 'pick up', 'pickup', 'drop off', 'amazon', 'store', 'grocery'],
-            'duration': 45,
-            'priority': 'medium'
-        },
-        'finance': {
-            'keywords': ['pay', 'bill', 'bank', 'tax', 'budget', 'invoice', 'rent', 'insurance'],
-            'duration': 30,
-            'priority': 'high'
-        },
-        'social': {
-            'keywords': ['call', 'meet', 'lunch', 'dinner', 'party', 'friend', 'family', 'mom', 'dad', 'coffee'],
-            'duration': 60,
-            'priority': 'medium'
-        },
-        'learning': {
-            'keywords': ['study', 'learn', 'read', 'course', 'class', 'practice', 'tutorial', 'exam'],
-            'duration': 90,
-            'priority': 'medium'
-        },
-        'home': {
-            'keywords': ['clean', 'cook', 'laundry', 'repair', 'organize', 'dishes', 'vacuum'],
-            'duration': 45,
-            'priority': 'low'
-        },
-        'personal': {
-            'keywords': ['appointment', 'haircut', 'spa', 'self-care', 'relax'],
-            'duration': 60,
-            'priority': 'low'
-        }
-    }
-    
-    for cat, config in category_config.items():
-        if any(kw in text for kw in config['keywords']):
+    for cat, pattern, config in _CATEGORY_RES:
+        if pattern.search(text):
             category = cat
             if not duration_match:  # Only set if user didn't specify
                 duration = config['duration']
@@ -344,8 +474,8 @@ def fallback_parse(user_input, reference_date=None):
             break
     
     # Clean up and beautify title
-    title = re.sub(r'\s+', ' ', title).strip()
-    title = re.sub(r'^(at|for|on)\s+', '', title, flags=re.IGNORECASE).strip()
+    title = _WS_RE.sub(' ', title).strip()
+    title = _LEADING_PREP_RE.sub('', title).strip()
     
     # Title beautification mappings
     title_upgrades = {
@@ -396,6 +526,14 @@ def fallback_parse(user_input, reference_date=None):
     }
 
 
+# ===== Database Helpers =====
+def dialect_insert(model):
+    """INSERT construct with ON CONFLICT support for the active database."""
+    if db.engine.dialect.name == 'postgresql':
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
 # ===== Auth Routes =====
 @app.route('/login')
 def login():
@@ -404,19 +542,28 @@ def login():
     return render_template('login.html', oauth_enabled=OAUTH_ENABLED, dev_mode=DEV_MODE)
 
 
+# Demo user id, cached after the first demo login
+_DEMO_USER_ID = None
+
+
 @app.route('/login/demo')
 def demo_login():
     """Quick login for development/demo without OAuth"""
-    # Find or create demo user
-    demo_user = User.query.filter_by(email='demo@tempo.app').first()
+    global _DEMO_USER_ID
+    demo_user = db.session.get(User, _DEMO_USER_ID) if _DEMO_USER_ID else None
+    
     if not demo_user:
-        demo_user = User(
-            email='demo@tempo.app',
-            name='Demo User',
-            google_id='demo-user-id'
+        # Create demo user if missing, in one statement
+        db.session.execute(
+            dialect_insert(User).values(
+                email='demo@tempo.app',
+                name='Demo User',
+                google_id='demo-user-id'
+            ).on_conflict_do_nothing(index_elements=['email'])
         )
-        db.session.add(demo_user)
         db.session.commit()
+        demo_user = User.query.filter_by(email='demo@tempo.app').one()
+        _DEMO_USER_ID = demo_user.id
     
     login_user(demo_user)
     return redirect(url_for('index'))
@@ -440,21 +587,27 @@ def google_callback():
         user_info = token.get('userinfo')
         
         if user_info:
-            user = User.query.filter_by(google_id=user_info['sub']).first()
-            
-            if not user:
-                user = User(
-                    google_id=user_info['sub'],
-                    email=user_info['email'],
-                    name=user_info.get('name', ''),
-                    picture=user_info.get('picture', '')
-                )
-                db.session.add(user)
-                db.session.commit()
-            else:
-                user.name = user_info.get('name', user.name)
-                user.picture = user_info.get('picture', user.picture)
-                db.session.commit()
+            # Create or refresh the user in one statement; missing profile
+            # fields keep their stored values
+            stmt = dialect_insert(User).values(
+                google_id=user_info['sub'],
+                email=user_info['email'],
+                name=user_info.get('name'),
+                picture=user_info.get('picture')
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['google_id'],
+                set_={
+                    'name': db.func.coalesce(stmt.excluded.name, User.name),
+                    'picture': db.func.coalesce(stmt.excluded.picture, User.picture)
+                }
+            ).returning(User)
+            user = db.session.scalars(
+                stmt, execution_options={'populate_existing': True}
+            ).one()
+            # Detach so commit doesn't expire it and login_user needs no reload
+            db.session.expunge(user)
+            db.session.commit()
             
             login_user(user)
             return redirect(url_for('index'))
@@ -472,21 +625,39 @@ def logout():
 
 
 # ===== Main Routes =====
+# Rendered once; the page holds no per-user data (see /api/bootstrap)
+_INDEX_HTML = None
+
+
 @app.route('/')
 @login_required
 def index():
-    today = date.today()
-    return render_template('index.html', 
-                         current_date=today, 
-                         categories=CATEGORIES, 
-                         user=current_user,
-                         gemini_enabled=GEMINI_ENABLED)
+    global _INDEX_HTML
+    if _INDEX_HTML is None:
+        _INDEX_HTML = render_template('index.html', categories=CATEGORIES)
+    return Response(_INDEX_HTML, mimetype='text/html')
+
+
+@app.route('/api/bootstrap')
+@login_required
+def get_bootstrap():
+    """Per-user page data, loaded by the client after the static index."""
+    return jsonify({
+        'user': {
+            'name': current_user.name,
+            'email': current_user.email,
+            'picture': current_user.picture
+        },
+        'gemini_enabled': GEMINI_ENABLED
+    })
 
 
 @app.route('/api/categories')
 @login_required
 def get_categories():
-    return jsonify(CATEGORIES)
+    response = Response(_CATEGORIES_JSON, mimetype='application/json')
+    response.headers['Cache-Control'] = 'private, max-age=86400'
+    return response
 
 
 @app.route('/api/tasks', methods=['GET'])
@@ -498,8 +669,12 @@ def get_tasks():
     except ValueError:
         query_date = date.today()
     
-    tasks = Task.query.filter_by(user_id=current_user.id, date=query_date).order_by(Task.time_slot).all()
-    return jsonify([task.to_dict() for task in tasks])
+    rows = db.session.execute(
+        db.select(*TASK_COLUMNS)
+        .where(Task.user_id == current_user.id, Task.date == query_date)
+        .order_by(Task.time_slot)
+    ).all()
+    return jsonify([task_to_dict(row) for row in rows])
 
 
 @app.route('/api/tasks/parse', methods=['POST'])
@@ -526,11 +701,8 @@ def parse_task():
     return jsonify(parsed)
 
 
-@app.route('/api/tasks', methods=['POST'])
-@login_required
-def create_task():
-    data = request.json
-    
+def task_fields(data):
+    """Column values for a new task owned by the current user."""
     task_date = date.today()
     if 'date' in data and data['date']:
         try:
@@ -539,25 +711,50 @@ def create_task():
             pass
     
     category = data.get('category', 'other')
-    cat_color = CATEGORIES.get(category, CATEGORIES['other'])['color']
-    
-    task = Task(
-        user_id=current_user.id,
-        title=data['title'],
-        description=data.get('description', ''),
-        date=task_date,
-        time_slot=data.get('time_slot'),
-        duration=data.get('duration', 60),
-        priority=data.get('priority', 'medium'),
-        color=cat_color,
-        category=category,
-        original_input=data.get('original_input', '')
-    )
+    return {
+        'user_id': current_user.id,
+        'title': data['title'],
+        'description': data.get('description', ''),
+        'date': task_date,
+        'time_slot': data.get('time_slot'),
+        'duration': data.get('duration', 60),
+        'priority': data.get('priority', 'medium'),
+        'color': _CAT_COLOR.get(category, _DEFAULT_COLOR),
+        'category': category,
+        'original_input': data.get('original_input', '')
+    }
+
+
+@app.route('/api/tasks', methods=['POST'])
+@login_required
+def create_task():
+    task = Task(**task_fields(request.json))
     db.session.add(task)
     db.session.commit()
     return jsonify(task.to_dict()), 201
 
 
+@app.route('/api/tasks/bulk', methods=['POST'])
+@login_required
+def create_tasks_bulk():
+    """Create many tasks in one executemany INSERT."""
+    data = request.json
+    if not isinstance(data, list):
+        return jsonify({'error': 'Expected a list of tasks'}), 400
+    for item in data:
+        if not isinstance(item, dict) or not item.get('title'):
+            return jsonify({'error': 'Each task must be an object with a title'}), 400
+    if not data:
+        return jsonify([]), 201
+    
+    rows = db.session.execute(
+        db.insert(Task).returning(*TASK_COLUMNS, sort_by_parameter_order=True),
+        [task_fields(item) for item in data]
+    ).all()
+    db.session.commit()
+    return jsonify([task_to_dict(row) for row in rows]), 201
+
+
 @app.route('/api/tasks/<int:task_id>', methods=['PUT'])
 @login_required
 def update_task(task_id):
@@ -572,8 +769,7 @@ def update_task(task_id):
     task.priority = data.get('priority', task.priority)
     task.category = data.get('category', task.category)
     
-    cat_color = CATEGORIES.get(task.category, CATEGORIES['other'])['color']
-    task.color = cat_color
+    task.color = _CAT_COLOR.get(task.category, _DEFAULT_COLOR)
     
     if 'date' in data:
         try:
@@ -588,24 +784,38 @@ def update_task(task_id):
 @app.route('/api/tasks/<int:task_id>', methods=['DELETE'])
 @login_required
 def delete_task(task_id):
-    task = Task.query.filter_by(id=task_id, user_id=current_user.id).first_or_404()
-    db.session.delete(task)
+    result = db.session.execute(
+        db.delete(Task).where(Task.id == task_id, Task.user_id == current_user.id)
+    )
     db.session.commit()
+    if result.rowcount == 0:
+        abort(404)
     return jsonify({'message': 'Task deleted'}), 200
 
 
 @app.route('/api/tasks/<int:task_id>/toggle', methods=['POST'])
 @login_required
 def toggle_task(task_id):
-    task = Task.query.filter_by(id=task_id, user_id=current_user.id).first_or_404()
-    task.completed = not task.completed
+    row = db.session.execute(
+        db.update(Task)
+        .where(Task.id == task_id, Task.user_id == current_user.id)
+        .values(completed=~Task.completed)
+        .returning(*TASK_COLUMNS)
+    ).first()
     db.session.commit()
-    return jsonify(task.to_dict())
+    if row is None:
+        abort(404)
+    return jsonify(task_to_dict(row))
 
 
 # Create tables
 with app.app_context():
     db.create_all()
+    # create_all skips existing tables, so add any new indexes explicitly.
+    # IF NOT EXISTS keeps this safe when several workers start at once.
+    for index in Task.__table__.indexes:
+        db.session.execute(CreateIndex(index, if_not_exists=True))
+    db.session.commit()
 
 
 if __name__ == '__main__':
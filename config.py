@@ -12,7 +12,18 @@ class Config:
     # Fix for Heroku PostgreSQL URL format
     if SQLALCHEMY_DATABASE_URI.startswith('postgres://'):
         SQLALCHEMY_DATABASE_URI = SQLALCHEMY_DATABASE_URI.replace('postgres://', 'postgresql://', 1)
+    # Use psycopg2 explicitly; the engine options below and the psycogreen
+    # hook in gunicorn.conf.py depend on it
+    if SQLALCHEMY_DATABASE_URI.startswith('postgresql://'):
+        SQLALCHEMY_DATABASE_URI = SQLALCHEMY_DATABASE_URI.replace('postgresql://', 'postgresql+psycopg2://', 1)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Batch multi-row INSERT/UPDATE statements (psycopg2-only options)
+    if SQLALCHEMY_DATABASE_URI.startswith('postgresql+psycopg2://'):
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'executemany_mode': 'values_plus_batch',
+            'insertmanyvalues_page_size': 1000,
+            'executemany_batch_page_size': 500
+        }
     
     # Google Gemini API
     GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
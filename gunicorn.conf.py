@@ -0,0 +1,28 @@
+# Gunicorn configuration (loaded automatically by `gunicorn app:app`)
+# Requests are I/O-bound (database, OAuth, Gemini), so use gevent workers
+# to serve many concurrent requests per process.
+
+import os
+import subprocess
+import sys
+
+# Each gevent worker is a full app copy but serves many connections, so
+# keep the default small; cpu_count() reports host cores, not the
+# container's limit. Override with WEB_CONCURRENCY.
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'gevent'
+worker_connections = 1000
+
+
+def on_starting(server):
+    # Importing app creates missing tables and indexes. Do it once, before
+    # any workers exist, so concurrent worker imports find the schema in
+    # place. A subprocess keeps the app out of the master, so it is still
+    # first imported after gevent patches each worker.
+    subprocess.run([sys.executable, '-c', 'import app'], cwd=server.cfg.chdir, check=True)
+
+
+def post_fork(server, worker):
+    # Make psycopg2 yield to other greenlets while waiting on PostgreSQL
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
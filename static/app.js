@@ -86,6 +86,16 @@ async function fetchTasks() {
     }
 }
 
+async function fetchBootstrap() {
+    try {
+        const response = await fetch('/api/bootstrap');
+        const data = await response.json();
+        renderUser(data.user);
+    } catch (error) {
+        console.error('Error fetching user info:', error);
+    }
+}
+
 async function parseTaskWithAI(input) {
     try {
         showToast('AI is parsing your task...');
@@ -572,6 +582,22 @@ function setupEventListeners() {
 }
 
 // ===== User Menu =====
+function renderUser(user) {
+    const avatar = document.getElementById('userAvatar');
+    document.getElementById('userName').textContent = user.name || '';
+    document.getElementById('userEmail').textContent = user.email || '';
+    
+    if (user.picture) {
+        const img = document.createElement('img');
+        img.src = user.picture;
+        img.alt = user.name || '';
+        img.className = 'user-avatar';
+        avatar.replaceWith(img);
+    } else {
+        avatar.textContent = user.name ? user.name[0] : 'U';
+    }
+}
+
 function setupUserMenu() {
     const userBtn = document.getElementById('userBtn');
     const dropdownMenu = document.getElementById('dropdownMenu');
@@ -595,6 +621,7 @@ function init() {
     renderCategorySelector();
     setupEventListeners();
     setupUserMenu();
+    fetchBootstrap();
     fetchTasks();
     
     // Set default date in form